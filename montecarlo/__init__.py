@@ -1 +1,3 @@
-from .montecarlo import Analyzer, Die, Game
+from .montecarlo import Analyzer, Die, Game, Replications
+from .parallel import SharedAnalyzer
+from .export import StatisticsWriter
@@ -0,0 +1,182 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .export import FILE_FORMATS, StatisticsWriter
+from .montecarlo import ROLL_BLOCK_SIZE, Die, Game
+from .parallel import SharedAnalyzer
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def _load_dice(path: str) -> list[Die]:
+    """
+    PURPOSE: This function reads die specs from a JSON or CSV file and creates the dice.
+    INPUT: path str
+    OUTPUT: list of Die
+
+    JSON: a list of dice, each with faces and optional weights
+        [{"faces": [1, 2, 3], "weights": [1, 1, 2]}, {"faces": [1, 2, 3]}]
+
+    CSV: one row per face, with an optional weight column
+        die,face,weight
+        0,1,1
+        0,2,3
+        1,1,1
+
+    Errors out if a die repeats a face, or if its weights are not finite, non-negative and adding
+    up to more than zero.
+    """
+    if path.lower().endswith(".json"):
+        with open(path) as file:
+            specs = json.load(file)
+        if not isinstance(specs, list) or not all(
+                isinstance(spec, dict) and isinstance(spec.get("faces"), list) for spec in specs):
+            raise ValueError("JSON die specs should be a list of objects, each with a list of faces.")
+        specs = [(spec["faces"], spec.get("weights")) for spec in specs]
+    elif path.lower().endswith(".csv"):
+        specs_df = pd.read_csv(path)
+        specs = [
+            (list(die_df["face"]), list(die_df["weight"]) if "weight" in die_df else None)
+            for _, die_df in specs_df.groupby("die", sort=False)
+        ]
+    else:
+        raise ValueError(f"Incorrect die spec file passed in: {path}, should be either a .json or .csv file.")
+
+    dice = []
+    for index, (faces, weights) in enumerate(specs):
+        if pd.Index(faces).has_duplicates:
+            raise ValueError(f"Faces of die {index} should be distinct. {faces}")
+
+        die = Die(faces)
+        if weights is not None:
+            if len(weights) != len(faces):
+                raise ValueError(f"Number of weights {len(weights)} does not match number of faces {len(faces)}.")
+
+            values = np.asarray(weights, dtype=np.float64)
+            if not np.isfinite(values).all() or (values < 0).any() or values.sum() <= 0:
+                raise ValueError(
+                    f"Weights of die {index} should be finite, non-negative and add up to more than zero. {weights}")
+            for face, weight in zip(faces, weights):
+                die.update_weight(face, weight)
+        dice.append(die)
+    return dice
+
+
+def _peak_memory() -> int | None:
+    """
+    PURPOSE: This function returns the peak resident memory in bytes of this process and its
+        finished worker processes, where the platform reports it.
+    INPUT: None
+    OUTPUT: int | None
+    """
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is in bytes on macOS and in kilobytes everywhere else.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    PURPOSE: This function builds the command-line argument parser.
+    INPUT: None
+    OUTPUT: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="montecarlo", description="Play and analyze a game of dice read from a JSON or CSV die spec file.")
+    parser.add_argument("dice", help="die spec file, .json or .csv")
+    parser.add_argument("-n", "--times", type=int, required=True, help="number of times to roll the dice")
+    parser.add_argument("--seed", type=int, help="game seed (default: random, printed at the end)")
+    parser.add_argument(
+        "--chunk-size", type=int, default=ROLL_BLOCK_SIZE, help="rolls analyzed per chunk (default: %(default)s)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes for in-memory analysis, not used by parquet/arrow output (default: %(default)s)")
+    parser.add_argument(
+        "--format",
+        choices=FILE_FORMATS + ("csv",),
+        help="output format, needs --output; parquet and arrow are streamed chunk by chunk (default: parquet)")
+    parser.add_argument("-o", "--output", help="directory to write the statistics to")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    PURPOSE: This function is the montecarlo console script. It plays and analyzes a game, writes
+        the statistics if an output directory is given, and reports the throughput and peak memory.
+    INPUT: argv list of str (default: command-line arguments)
+    OUTPUT: int exit code
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.times < 1:
+        parser.error(f"--times should be at least 1, got {args.times}")
+    if args.chunk_size < 1:
+        parser.error(f"--chunk-size should be at least 1, got {args.chunk_size}")
+    if args.seed is not None and not 0 <= args.seed < 2 ** 128:
+        parser.error(f"--seed should be between 0 and 2 ** 128, got {args.seed}")
+    if args.workers < 1:
+        parser.error(f"--workers should be at least 1, got {args.workers}")
+    if args.format is not None and not args.output:
+        parser.error("--format only applies when --output is given")
+    if args.output and args.format is None:
+        args.format = "parquet"
+    if args.format in FILE_FORMATS and args.workers > 1:
+        parser.error(f"--workers only applies to in-memory analysis, {args.format} output is streamed in one process")
+
+    try:
+        game = Game(dice=_load_dice(args.dice), seed=args.seed)
+        if not game.dice:
+            raise ValueError("Incorrect number of dice detected, please double check and try again.")
+    except (OSError, KeyError, TypeError, ValueError) as error:
+        parser.error(f"could not read die specs from {args.dice}: {error}")
+
+    start = time.perf_counter()
+    if args.format in FILE_FORMATS:
+        try:
+            writer = StatisticsWriter(game, args.output, args.format, args.chunk_size)
+        except (ImportError, ValueError) as error:
+            parser.error(str(error))
+        writer.write(times=args.times)
+        num_of_jackpots = None
+    else:
+        game.play(times=args.times)
+        with SharedAnalyzer(game, workers=args.workers, chunk_size=args.chunk_size) as analyzer:
+            num_of_jackpots = analyzer.calculate_jackpots()
+            analyzer.calculate_combos()
+            analyzer.calculate_face_rolled_occurrences()
+
+        if args.output:
+            os.makedirs(args.output, exist_ok=True)
+            analyzer.jackpots_df.to_csv(os.path.join(args.output, "jackpots.csv"))
+            analyzer.combos_df.to_csv(os.path.join(args.output, "combos.csv"))
+            analyzer.face_rolled_occurrences_df.to_csv(os.path.join(args.output, "face_rolled_occurrences.csv"))
+    elapsed = time.perf_counter() - start
+
+    peak_memory = _peak_memory()
+    print(f"seed: {game.seed}")
+    print(f"rolls: {args.times} x {len(game.dice)} dice")
+    if num_of_jackpots is not None:
+        print(f"jackpots: {num_of_jackpots}")
+    print(f"elapsed: {elapsed:.3f} s")
+    print(f"rolls/sec: {args.times / elapsed:,.0f}" if elapsed > 0 else "rolls/sec: n/a")
+    print(f"peak memory: {peak_memory / 2 ** 20:,.1f} MiB" if peak_memory is not None else "peak memory: n/a")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+import os
+
+import numpy as np
+
+from .montecarlo import ROLL_BLOCK_SIZE, Game, _smallest_uint
+from .parallel import _count_combos, _count_face_occurrences, _count_jackpots, _merge_combos, _sum_combos
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pa = None
+
+
+FILE_FORMATS = ("parquet", "arrow")
+
+
+class StatisticsWriter:
+    """
+    A statistics writer analyzes a game chunk by chunk and streams the results out to Arrow IPC or
+    Parquet files in record batches, so the full tables are never held in memory. Jackpots and face
+    rolled occurrences are written one batch per chunk, combos are written once all chunks are counted.
+
+    Methods:
+        - _path
+        - _open_sink
+        - _rolls
+        - write
+    """
+    def __init__(
+        self, game: Game, directory: str, file_format: str = "parquet", chunk_size: int = ROLL_BLOCK_SIZE
+    ) -> None:
+        if pa is None:
+            raise ImportError("pyarrow is required to write statistics, install it with: pip install montecarlo[arrow]")
+
+        if len(game.dice) < 1:
+            raise ValueError("Incorrect number of dice detected, please double check and try again.")
+
+        if file_format.lower() not in FILE_FORMATS:
+            raise ValueError(
+                f"Incorrect file format passed in: {file_format}, should be either \"parquet\" or \"arrow\".")
+
+        if chunk_size < 1:
+            raise ValueError(f"Incorrect chunk size passed in: {chunk_size}, should be at least 1.")
+
+        faces = game._get_faces().tolist()
+        try:
+            pa.array(faces)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            raise ValueError(f"Faces {faces} should all be of one type to be written to {file_format}.")
+        if len({str(face) for face in faces}) < len(faces):
+            raise ValueError(f"Faces {faces} should be distinct as text, they name the face rolled occurrences columns.")
+
+        self.game = game
+        self.directory = directory
+        self.file_format = file_format.lower()
+        self.chunk_size = chunk_size
+
+    def _path(self, name: str) -> str:
+        """
+        PURPOSE: This method returns the file path of one of the statistics files.
+        INPUT: name str
+        OUTPUT: str
+        """
+        return os.path.join(self.directory, f"{name}.{self.file_format}")
+
+    def _open_sink(self, name: str, schema: "pa.Schema"):
+        """
+        PURPOSE: This method opens a record batch writer for one of the statistics files.
+        INPUT:
+            1. name str
+            2. schema pyarrow schema
+        OUTPUT: pyarrow record batch writer
+        """
+        if self.file_format == "parquet":
+            return pa.parquet.ParquetWriter(self._path(name), schema)
+        return pa.ipc.new_file(self._path(name), schema)
+
+    def _rolls(self, start: int, stop: int, times: int | None) -> np.ndarray:
+        """
+        PURPOSE: This method returns the face codes of a chunk of rolls, either sliced from the most
+            recent play or regenerated from the game seed when times is passed in.
+        INPUT:
+            1. start int
+            2. stop int
+            3. times int | None
+        OUTPUT: np.ndarray (rolls x dice) of face codes
+        """
+        return self.game.roll_range(start, stop) if times is not None else self.game._rolls[start:stop]
+
+    def write(self, times: int | None = None) -> dict[str, str]:
+        """
+        PURPOSE: This method analyzes the game chunk by chunk and writes the jackpots, combos and face
+            rolled occurrences files into the directory. Without times the most recent play is
+            written; with times the rolls are regenerated chunk by chunk and the game is never played
+            in full.
+        INPUT: times int | None
+        OUTPUT: dict of statistic name to file path
+
+        Errors out if times is negative, or if times is not passed in and the game was never played.
+
+        FILE STRUCTURES:
+            jackpots: roll_number | face_rolled | occurrences
+            combos: face_rolled | occurrences
+            face_rolled_occurrences: roll_number | one column per face
+        """
+        if times is not None and times < 0:
+            raise ValueError(f"Incorrect number of times passed in: {times}, should be at least 0.")
+
+        if times is None and self.game._faces.size == 0:
+            raise ValueError("The game has not been played yet, play it or pass in times.")
+
+        if times is None:
+            faces = self.game._faces
+            num_of_rolls = self.game._rolls.shape[0]
+        else:
+            faces = self.game._get_faces()
+            num_of_rolls = times
+        num_of_dice = len(self.game.dice)
+        os.makedirs(self.directory, exist_ok=True)
+
+        face_type = pa.array(faces).type
+        roll_number_type = pa.from_numpy_dtype(_smallest_uint(num_of_rolls))
+        occurrences_type = pa.from_numpy_dtype(_smallest_uint(num_of_dice))
+
+        jackpots_schema = pa.schema([
+            ('roll_number', roll_number_type), ('face_rolled', face_type), ('occurrences', occurrences_type)])
+        face_rolled_occurrences_schema = pa.schema(
+            [('roll_number', roll_number_type)] + [(str(face), occurrences_type) for face in faces.tolist()])
+        combos_schema = pa.schema([('face_rolled', pa.string()), ('occurrences', pa.int64())])
+
+        combos = []
+        with self._open_sink("jackpots", jackpots_schema) as jackpots_sink, \
+                self._open_sink("face_rolled_occurrences", face_rolled_occurrences_schema) as occurrences_sink:
+            for start in range(0, num_of_rolls, self.chunk_size):
+                stop = min(start + self.chunk_size, num_of_rolls)
+                rolls = self._rolls(start, stop, times)
+
+                positions, codes = _count_jackpots(rolls, start)
+                jackpots_sink.write_batch(pa.record_batch([
+                    pa.array(positions + 1, type=roll_number_type),
+                    pa.array(faces[codes], type=face_type),
+                    pa.array(np.full(len(positions), num_of_dice), type=occurrences_type)
+                ], schema=jackpots_schema))
+
+                occurrences = _count_face_occurrences(rolls, len(faces))
+                occurrences_sink.write_batch(pa.record_batch(
+                    [pa.array(np.arange(start + 1, stop + 1), type=roll_number_type)]
+                    + [pa.array(occurrences[:, code], type=occurrences_type) for code in range(len(faces))],
+                    schema=face_rolled_occurrences_schema))
+
+                combos = [_sum_combos(combos + [_count_combos(rolls)])]
+
+        with self._open_sink("combos", combos_schema) as combos_sink:
+            if combos:
+                combos_df = _merge_combos(combos, faces).reset_index()
+                combos_sink.write_batch(
+                    pa.RecordBatch.from_pandas(combos_df, schema=combos_schema, preserve_index=False))
+
+        return {name: self._path(name) for name in ("jackpots", "combos", "face_rolled_occurrences")}
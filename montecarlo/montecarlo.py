@@ -6,6 +6,38 @@ import pandas as pd
 
 
 DEFAULT_WEIGHT = 1.0
+ROLL_BLOCK_SIZE = 65_536
+PLAY_STREAM = 0
+REPLICATIONS_STREAM = 1
+
+
+def _smallest_uint(value: int) -> np.dtype:
+    """
+    PURPOSE: This function picks the smallest unsigned integer dtype that can hold a value.
+    INPUT: value int
+    OUTPUT: np.dtype
+    """
+    return np.min_scalar_type(max(int(value), 0))
+
+
+def _unique_combos(combos: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    PURPOSE: This function finds the distinct rows of a matrix of sorted face code combinations,
+        along with the position of each row's combination and how often each one occurs.
+    INPUT: combos np.ndarray (rows x dice), each row sorted
+    OUTPUT: tuple of distinct combinations (combos x dice), inverse (rows) and counts (combos)
+    """
+    base = int(combos.max()) + 1 if combos.size else 1
+    if base ** combos.shape[1] > np.iinfo(np.int64).max:
+        unique, inverse, counts = np.unique(combos, axis=0, return_inverse=True, return_counts=True)
+        return unique, inverse.ravel(), counts
+
+    # Packing each sorted row into one integer keeps the row order and is much faster to unique.
+    keys = np.zeros(combos.shape[0], dtype=np.int64)
+    for column in combos.T:
+        keys = keys * base + column
+    _, first, inverse, counts = np.unique(keys, return_index=True, return_inverse=True, return_counts=True)
+    return combos[first], inverse.ravel(), counts
 
 
 class Die:
@@ -70,51 +102,179 @@ class Game:
     """
     A game consists of rolling of one or more dice of the same kind one or more times.
 
+    Rolls are drawn from a counter-based Philox generator keyed by the game seed. Rolls are grouped
+    into blocks of block_size, and every block has its own counter range, so any block can be
+    regenerated on its own without replaying the blocks before it.
+
+    Only the face codes of the most recent play are stored, in the smallest unsigned integer dtype
+    that fits the number of faces. Roll and die numbers are derived from the position in the
+    roll-code matrix whenever the play dataframe is shown.
+
     Methods:
-        - _get_roll_number
-        - _get_die_number
-        - _roll_dice
+        - _get_faces
+        - _bit_generator
+        - _roll_codes
+        - roll_block
+        - roll_range
+        - roll_replications
         - play
         - show
+        - memory_usage
     """
-    def __init__(self, dice: list[Die]) -> None:
+    def __init__(self, dice: list[Die], seed: int | None = None, block_size: int = ROLL_BLOCK_SIZE) -> None:
+        if seed is not None and (not isinstance(seed, numbers.Integral) or not 0 <= seed < 2 ** 128):
+            raise ValueError(f"Seed {seed} should be an integer between 0 and 2 ** 128.")
+
+        if not isinstance(block_size, numbers.Integral) or block_size < 1:
+            raise ValueError(f"Block size {block_size} should be a positive integer.")
+
         self.dice = dice
-        self._play_df = pd.DataFrame({})
+        self.seed = np.random.SeedSequence().entropy if seed is None else int(seed)
+        self.block_size = int(block_size)
+        self._faces = np.array([])
+        self._rolls = np.empty((0, len(dice)), dtype=np.uint8)
 
-    def _get_roll_number(self, times: int) -> list[int]:
+    def _get_faces(self) -> np.ndarray:
         """
-        PURPOSE: This method maps out the roll numbers base on the number of
-            times user asks to roll and how many dice there are.
-        INPUT: times int
-        OUTPUT: list of int
+        PURPOSE: This method collects the distinct faces of all dice. A face code is the position
+            of a face in this array. Faces that can be compared are sorted, so sorting codes sorts
+            the faces they stand for; mixed faces keep the order they first appear in.
+        INPUT: None
+        OUTPUT: np.ndarray
         """
-        return [x for _ in self.dice for x in range(1, times + 1)]
+        if not self.dice:
+            return np.array([])
+
+        faces = pd.unique(np.concatenate([die.show()['faces'].to_numpy(dtype=object) for die in self.dice]))
+        try:
+            return pd.Index(sorted(faces)).to_numpy()
+        except TypeError:
+            return faces
 
-    def _get_die_number(self, times: int) -> list[int]:
+    def _bit_generator(self, block: int, stream: int = PLAY_STREAM) -> np.random.Philox:
         """
-        PURPOSE: This method maps out the indices base on the die list index position
-            from the list passed in during instantiation.
-        INPUT: times int
-        OUTPUT: list of int
+        PURPOSE: This method creates the Philox bit generator of a single block. The block index and
+            stream are written straight into the counter, so each block draws from its own range.
+        INPUT:
+            1. block int
+            2. stream int
+        OUTPUT: np.random.Philox
         """
-        return [index for index, _ in enumerate(self.dice) for _ in range(times)]
+        return np.random.Philox(key=self.seed, counter=[0, 0, block, stream])
 
-    def _roll_dice(self, times: int) -> list[str | float]:
+    def _roll_codes(self, uniforms: np.ndarray) -> np.ndarray:
         """
-        PURPOSE: This method go through each die passed in the die list and roll the
-            die as many times as specified until the die list is exhausted.
-        INPUT: times int
-        OUTPUT: list of number or string
+        PURPOSE: This method turns uniform draws into face codes by looking each draw up in the
+            cumulative weights of its die. The last axis of the draws runs over the dice. Errors
+            out if the weights of a die cannot be drawn from.
+        INPUT: uniforms np.ndarray (... x dice)
+        OUTPUT: np.ndarray (... x dice) of face codes
+        """
+        faces = pd.Index(self._get_faces())
+        codes = np.empty(uniforms.shape, dtype=_smallest_uint(len(faces) - 1))
+        for index, die in enumerate(self.dice):
+            die_df = die.show()
+            weights = die_df['weights'].to_numpy(dtype=np.float64)
+            if not np.isfinite(weights).all() or (weights < 0).any() or weights.sum() <= 0:
+                raise ValueError(
+                    f"Weights of die {index} should be finite, non-negative and add up to more than zero. "
+                    f"{list(weights)}")
+
+            cdf = np.cumsum(weights)
+            local_codes = np.searchsorted(cdf / cdf[-1], uniforms[..., index], side='right')
+            codes[..., index] = faces.get_indexer(die_df['faces'])[np.minimum(local_codes, len(cdf) - 1)]
+        return codes
+
+    def roll_block(self, block: int, rolls: int | None = None, first: int = 0) -> np.ndarray:
+        """
+        PURPOSE: This method regenerates the face codes of one block of rolls, independent from
+            every other block. Passing first and rolls returns only those rows of the block, and
+            the rows before first are skipped over rather than drawn.
+        INPUT:
+            1. block int
+            2. rolls int (default: rest of the block)
+            3. first int (default: 0)
+        OUTPUT: np.ndarray (rolls x dice) of face codes
+
+        EXAMPLE: 2 dice with 6 faces, first 3 rolls of block 0
+
+                die number  |   0   |   1
+        roll number - 1     |
+                0               1       1
+                1               2       0
+                2               5       3
         """
-        results = []
-        for die in self.dice:
-            results.extend(die.roll(times=times))
-        return results
+        if block < 0:
+            raise ValueError(f"Block index {block} should not be negative.")
+
+        if not 0 <= first < self.block_size:
+            raise ValueError(f"First roll {first} should be within the block size {self.block_size}.")
+
+        rolls = self.block_size - first if rolls is None else min(rolls, self.block_size - first)
+        num_of_dice = len(self.dice)
+        bit_generator = self._bit_generator(block)
+
+        # Philox yields four draws per counter step, so whole steps are skipped and the rest dropped.
+        skipped = first * num_of_dice
+        bit_generator.advance(skipped // 4)
+        uniforms = np.random.Generator(bit_generator).random(skipped % 4 + rolls * num_of_dice)[skipped % 4:]
+        return self._roll_codes(uniforms.reshape(rolls, num_of_dice))
+
+    def roll_range(self, start: int, stop: int) -> np.ndarray:
+        """
+        PURPOSE: This method regenerates the face codes of rolls start to stop (0-based, stop
+            excluded) by regenerating only the parts of the blocks that cover them.
+        INPUT:
+            1. start int
+            2. stop int
+        OUTPUT: np.ndarray (rolls x dice) of face codes
+        """
+        if not 0 <= start <= stop:
+            raise ValueError(f"Incorrect roll range passed in: {start} to {stop}.")
+
+        blocks = []
+        for block in range(start // self.block_size, -(-stop // self.block_size)):
+            block_start = block * self.block_size
+            first = max(start - block_start, 0)
+            rolls = min(stop, block_start + self.block_size) - block_start - first
+            blocks.append(self.roll_block(block, rolls=rolls, first=first))
+
+        return np.concatenate(blocks) if blocks else np.empty((0, len(self.dice)), dtype=np.uint8)
+
+    def roll_replications(self, replications: int, times: int, first: int = 0) -> np.ndarray:
+        """
+        PURPOSE: This method rolls the dice for many independent games at once, from a stream of its
+            own so it never overlaps with the rolls of play. Every replication has its own counter
+            range, so replication first onwards can be regenerated by index and consecutive batches
+            never repeat each other. Draws are made a block of rolls at a time.
+        INPUT:
+            1. replications int
+            2. times int
+            3. first int, index of the first replication (default: 0)
+        OUTPUT: np.ndarray (replications x times x dice) of face codes
+        """
+        if first < 0:
+            raise ValueError(f"First replication {first} should not be negative.")
+
+        num_of_dice = len(self.dice)
+        # Philox yields four draws per counter step, each replication starts on a step of its own.
+        steps = -(-times * num_of_dice // 4)
+        chunk = max(self.block_size // max(times, 1), 1)
+
+        codes = []
+        for start in range(first, first + replications, chunk):
+            stop = min(start + chunk, first + replications)
+            bit_generator = self._bit_generator(0, REPLICATIONS_STREAM)
+            bit_generator.advance(start * steps)
+            uniforms = np.random.Generator(bit_generator).random((stop - start, steps * 4))
+            codes.append(self._roll_codes(uniforms[:, :times * num_of_dice].reshape(-1, times, num_of_dice)))
+        return np.concatenate(codes) if codes else np.empty((0, times, num_of_dice), dtype=np.uint8)
 
     def play(self, times: int) -> None:
         """
         PURPOSE: This method will roll the dice passed in as many time as specified, and
-            save the result to the instance object for future usage.
+            save the result to the instance object for future usage. The same seed always
+            plays the same rolls.
         INPUT: times int
         OUTPUT: None
 
@@ -128,14 +288,25 @@ class Game:
                 2                  1               1
                 3                  1               4
         """
-        roll_number = self._get_roll_number(times)
-        die_number = self._get_die_number(times)
-        face_rolled = self._roll_dice(times)
+        self._faces = self._get_faces()
+        self._rolls = self.roll_range(0, times)
 
-        self._play_df = pd.DataFrame({
-            'roll_number': roll_number,
-            'die_number': die_number,
-            'face_rolled': face_rolled
+    @property
+    def _play_df(self) -> pd.DataFrame:
+        """
+        PURPOSE: This property builds the play dataframe from the roll-code matrix, with roll and
+            die numbers taken from the matrix position in the smallest dtypes that fit them.
+        INPUT: None
+        OUTPUT: Pandas dataframe
+        """
+        times, num_of_dice = self._rolls.shape
+        roll_number = np.arange(1, times + 1, dtype=_smallest_uint(times))
+        die_number = np.arange(num_of_dice, dtype=_smallest_uint(num_of_dice - 1))
+
+        return pd.DataFrame({
+            'roll_number': np.tile(roll_number, num_of_dice),
+            'die_number': np.repeat(die_number, times),
+            'face_rolled': self._faces[self._rolls.T.ravel()] if num_of_dice else []
         }).set_index('roll_number')
 
     def show(self, display: str = "wide") -> pd.DataFrame:
@@ -184,6 +355,15 @@ class Game:
         return  narrow_df \
             if display.lower() == 'narrow' else narrow_df.unstack('die_number')
 
+    def memory_usage(self) -> int:
+        """
+        PURPOSE: This method returns how many bytes the most recent play takes up in memory: the
+            roll-code matrix plus the faces it refers to, including string and other object faces.
+        INPUT: None
+        OUTPUT: int
+        """
+        return self._rolls.nbytes + int(pd.Index(self._faces).memory_usage(deep=True))
+
 class Analyzer:
     """
     An analyzer takes the results of a single game and computes various descriptive statistical properties
@@ -302,3 +482,110 @@ class Analyzer:
             .groupby(by=['roll_number', 'face_rolled']).size() \
             .unstack('face_rolled') \
             .fillna(0)
+
+
+class Replications:
+    """
+    A replications object plays many independent games of the same dice in one call, and computes
+    the descriptive statistical properties of every game at once. Results are indexed by replication
+    number and available as attributes of a Replications object. Passing first continues from an
+    earlier batch, replication numbers run from first + 1.
+
+    Methods:
+        - calculate_jackpots
+        - calculate_combos
+        - calculate_face_frequencies
+    """
+    def __init__(self, game: Game, replications: int, times: int, first: int = 0) -> None:
+        if len(game.dice) < 1:
+            raise ValueError("Incorrect number of dice detected, please double check and try again.")
+
+        if not isinstance(replications, numbers.Integral) or replications < 1:
+            raise ValueError(f"Incorrect number of replications passed in: {replications}, should be at least 1.")
+
+        if not isinstance(times, numbers.Integral) or times < 1:
+            raise ValueError(f"Incorrect number of times passed in: {times}, should be at least 1.")
+
+        if not isinstance(first, numbers.Integral) or first < 0:
+            raise ValueError(f"Incorrect first replication passed in: {first}, should not be negative.")
+
+        self.game = game
+        self.replications = replications
+        self.times = times
+        self.first = first
+        self._faces = game._get_faces()
+        self._rolls = game.roll_replications(replications, times, first)
+        self._replication_number = pd.Index(
+            np.arange(first + 1, first + replications + 1, dtype=_smallest_uint(first + replications)),
+            name='replication')
+        self.jackpots_df = None
+        self.combos_df = None
+        self.face_frequencies_df = None
+
+    def calculate_jackpots(self) -> pd.Series:
+        """
+        PURPOSE: This method computes how many times each game resulted in all faces being identical.
+        INPUT: None
+        OUTPUT: Pandas series indexed by replication
+
+        SAVED DF STRUCTURE:
+                             |  jackpots
+        replication (index)  |
+                1                 2
+                2                 0
+        """
+        jackpots = pd.Series(
+            (self._rolls == self._rolls[..., :1]).all(axis=-1).sum(axis=-1),
+            index=self._replication_number,
+            name='jackpots')
+        self.jackpots_df = jackpots.to_frame()
+        return jackpots
+
+    def calculate_combos(self) -> None:
+        """
+        PURPOSE: This method computes how many times each distinct combination of faces was rolled
+            in each game, with the sorted combinations as columns.
+        INPUT: None
+        OUTPUT: None
+
+        SAVED DF STRUCTURE:
+                face rolled  |  (1, 1)  |  (1, 2)  |  (2, 2)  |
+        replication (index)  |
+                1                 1          2          0
+                2                 0          1          2
+        """
+        num_of_dice = self._rolls.shape[-1]
+        combos, inverse, _ = _unique_combos(np.sort(self._rolls, axis=-1).reshape(-1, num_of_dice))
+
+        replication = np.repeat(np.arange(self.replications), self.times)
+        occurrences = np.bincount(
+            replication * len(combos) + inverse, minlength=self.replications * len(combos))
+
+        face_values = self._faces.tolist()
+        labels = [str(tuple(face_values[code] for code in combo)) for combo in combos]
+        self.combos_df = pd.DataFrame(
+            occurrences.reshape(self.replications, len(combos)),
+            index=self._replication_number,
+            columns=pd.Index(labels, name='face_rolled'))
+
+    def calculate_face_frequencies(self) -> None:
+        """
+        PURPOSE: This method computes how many times each face was rolled in each game.
+        INPUT: None
+        OUTPUT: None
+
+        SAVED DF STRUCTURE:
+                face rolled  |   1   |   2   |
+        replication (index)  |
+                1                 4       2
+                2                 1       5
+        """
+        num_of_faces = len(self._faces)
+        replication = np.arange(self.replications)[:, None, None]
+        frequencies = np.bincount(
+            (replication * num_of_faces + self._rolls).ravel(), minlength=self.replications * num_of_faces)
+
+        self.face_frequencies_df = pd.DataFrame(
+            frequencies.reshape(self.replications, num_of_faces),
+            index=self._replication_number,
+            columns=pd.Index(self._faces, name='face_rolled'))
@@ -0,0 +1,332 @@
+import functools
+import math
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .montecarlo import Analyzer, Game, _smallest_uint, _unique_combos
+
+
+def _count_jackpots(rolls: np.ndarray, start: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    PURPOSE: This function finds the rolls within a block of the roll-code matrix where every die
+        landed on the same face.
+    INPUT:
+        1. rolls np.ndarray (rolls x dice)
+        2. start int, position of the first roll of the block within the game
+    OUTPUT: tuple of roll positions and face codes
+    """
+    positions = np.flatnonzero((rolls == rolls[:, :1]).all(axis=1))
+    return positions + start, rolls[positions, 0]
+
+
+def _count_combos(rolls: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    PURPOSE: This function counts the distinct sorted face code combinations within a block of
+        the roll-code matrix.
+    INPUT: rolls np.ndarray (rolls x dice)
+    OUTPUT: tuple of distinct combinations (combos x dice) and their counts
+    """
+    combos, _, counts = _unique_combos(np.sort(rolls, axis=1))
+    return combos, counts
+
+
+def _count_face_occurrences(rolls: np.ndarray, num_of_faces: int) -> np.ndarray:
+    """
+    PURPOSE: This function counts how many times each face code is rolled in each roll of a block
+        of the roll-code matrix.
+    INPUT:
+        1. rolls np.ndarray (rolls x dice)
+        2. num_of_faces int
+    OUTPUT: np.ndarray (rolls x faces)
+    """
+    cells = np.arange(rolls.shape[0])[:, None] * num_of_faces + rolls
+    return np.bincount(cells.ravel(), minlength=rolls.shape[0] * num_of_faces) \
+        .reshape(rolls.shape[0], num_of_faces)
+
+
+def _count_partial(rolls: np.ndarray, start: int, stop: int, num_of_faces: int, statistic: str):
+    """
+    PURPOSE: This function computes the partial counts of a single statistic over a range of rolls.
+    INPUT:
+        1. rolls np.ndarray (rolls x dice)
+        2. start int
+        3. stop int
+        4. num_of_faces int
+        5. statistic str, one of "jackpots", "combos" or "face_rolled_occurrences"
+    OUTPUT: partial counts, see the _count_* functions
+    """
+    block = rolls[start:stop]
+    if statistic == "jackpots":
+        return _count_jackpots(block, start)
+    if statistic == "combos":
+        return _count_combos(block)
+    return _count_face_occurrences(block, num_of_faces)
+
+
+def _count_shared(
+    name: str, shape: tuple[int, int], dtype: str, num_of_faces: int, statistic: str, row_range: tuple[int, int]
+):
+    """
+    PURPOSE: This function runs inside a worker process. It attaches to the shared roll-code matrix
+        without copying it and computes the partial counts over its range of rolls.
+    INPUT:
+        1. name str, shared memory block name
+        2. shape tuple of int
+        3. dtype str
+        4. num_of_faces int
+        5. statistic str
+        6. row_range tuple of int (start, stop)
+    OUTPUT: partial counts, see the _count_* functions
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        rolls = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        partial = _count_partial(rolls, *row_range, num_of_faces, statistic)
+        # Results are fancy-indexed copies, the view has to go before the block can be closed.
+        del rolls
+        return partial
+    finally:
+        shm.close()
+
+
+def _merge_jackpots(partials: list, faces: np.ndarray, num_of_dice: int, num_of_rolls: int) -> pd.DataFrame:
+    """
+    PURPOSE: This function merges partial jackpot counts into the same dataframe
+        Analyzer.calculate_jackpots saves.
+    INPUT:
+        1. partials list of tuple
+        2. faces np.ndarray
+        3. num_of_dice int
+        4. num_of_rolls int
+    OUTPUT: dataframe
+    """
+    positions = np.concatenate([positions for positions, _ in partials])
+    codes = np.concatenate([codes for _, codes in partials])
+    return pd.DataFrame({
+        'roll_number': (positions + 1).astype(_smallest_uint(num_of_rolls)),
+        'face_rolled': pd.Index(faces).take(codes),
+        'occurrences': np.full(len(positions), num_of_dice, dtype=np.int64)
+    }).set_index(['roll_number', 'face_rolled'])
+
+
+def _sum_combos(partials: list) -> tuple[np.ndarray, np.ndarray]:
+    """
+    PURPOSE: This function adds up partial combination counts.
+    INPUT: partials list of tuple
+    OUTPUT: tuple of distinct combinations (combos x dice) and their counts
+    """
+    combos, inverse, _ = _unique_combos(np.concatenate([combos for combos, _ in partials]))
+    occurrences = np.bincount(
+        inverse, weights=np.concatenate([counts for _, counts in partials]), minlength=len(combos))
+    return combos, occurrences.astype(np.int64)
+
+
+def _merge_combos(partials: list, faces: np.ndarray) -> pd.DataFrame:
+    """
+    PURPOSE: This function merges partial combination counts into the same dataframe
+        Analyzer.calculate_combos saves.
+    INPUT:
+        1. partials list of tuple
+        2. faces np.ndarray
+    OUTPUT: dataframe
+    """
+    combos, occurrences = _sum_combos(partials)
+
+    face_values = faces.tolist()
+    labels = [str(tuple(face_values[code] for code in combo)) for combo in combos]
+
+    return pd.Series(occurrences, index=pd.Index(labels, name='face_rolled')) \
+        .sort_index() \
+        .to_frame('occurrences') \
+        .sort_values('occurrences', ascending=False)
+
+
+def _merge_face_occurrences(partials: list, faces: np.ndarray) -> pd.DataFrame:
+    """
+    PURPOSE: This function merges partial face occurrence counts into the same dataframe
+        Analyzer.calculate_face_rolled_occurrences saves. Faces never rolled are left out and
+        the counts are floats whenever a face is missing from a roll, as with unstack.
+    INPUT:
+        1. partials list of np.ndarray
+        2. faces np.ndarray
+    OUTPUT: dataframe
+    """
+    occurrences = np.concatenate(partials)
+    rolled = occurrences.any(axis=0)
+    occurrences = occurrences[:, rolled]
+    if (occurrences == 0).any():
+        occurrences = occurrences.astype(np.float64)
+
+    return pd.DataFrame(
+        occurrences,
+        index=pd.Index(
+            np.arange(1, occurrences.shape[0] + 1, dtype=_smallest_uint(occurrences.shape[0])), name='roll_number'),
+        columns=pd.Index(faces, name='face_rolled')[rolled])
+
+
+def _release_shared_memory(shm: shared_memory.SharedMemory) -> None:
+    """
+    PURPOSE: This function detaches from a shared memory block and frees it. It is registered as a
+        finalizer, so the block is freed even when close is never called.
+    INPUT: shm SharedMemory
+    OUTPUT: None
+    """
+    try:
+        shm.close()
+    except BufferError:
+        # A view of the block is still alive somewhere, the mapping goes away with it.
+        pass
+    shm.unlink()
+
+
+class SharedRolls:
+    """
+    A shared rolls buffer holds a game's roll-code matrix in a named shared memory block, so
+    worker processes can attach to it instead of receiving a pickled copy of the play dataframe.
+
+    The matrix is copied into the block, so while the buffer is open the parent process holds it
+    twice: once in the game and once in shared memory. The block is freed by close, or once the
+    buffer is garbage collected.
+
+    Methods:
+        - close
+    """
+    def __init__(self, rolls: np.ndarray) -> None:
+        self.source = rolls
+        self.shape = rolls.shape
+        self.dtype = rolls.dtype
+        self._shm = shared_memory.SharedMemory(create=True, size=max(rolls.nbytes, 1))
+        self._finalizer = weakref.finalize(self, _release_shared_memory, self._shm)
+        self.name = self._shm.name
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)
+        self.array[:] = rolls
+
+    def close(self) -> None:
+        """
+        PURPOSE: This method detaches from the shared memory block and frees it.
+        INPUT: None
+        OUTPUT: None
+        """
+        del self.array
+        self._finalizer()
+
+
+class SharedAnalyzer(Analyzer):
+    """
+    A shared analyzer computes the same statistical properties as an analyzer, but splits the rolls
+    into row ranges and counts them in worker processes that share the game's roll-code matrix.
+    The partial counts are merged back into the usual Analyzer attributes.
+
+    The worker processes are started on the first calculation and kept until close, or until the
+    analyzer is garbage collected, so later calculations do not pay for process startup again.
+
+    Methods:
+        - _map
+        - calculate_jackpots
+        - calculate_combos
+        - calculate_face_rolled_occurrences
+        - close
+    """
+    def __init__(self, game: Game, workers: int | None = None, chunk_size: int | None = None) -> None:
+        super().__init__(game)
+        if workers is not None and workers < 1:
+            raise ValueError(f"Incorrect number of workers passed in: {workers}, should be at least 1.")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"Incorrect chunk size passed in: {chunk_size}, should be at least 1.")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._shared_rolls = None
+        self._executor = None
+        self._executor_finalizer = None
+
+    def __enter__(self) -> "SharedAnalyzer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _map(self, statistic: str) -> list:
+        """
+        PURPOSE: This method copies the game's roll-code matrix into shared memory (once per play),
+            fans the row ranges out over the worker processes (started on the first call) and
+            collects the partial counts in row order. With a single worker the row ranges are
+            counted in this process, without shared memory.
+        INPUT: statistic str
+        OUTPUT: list of partial counts
+        """
+        rolls = self.game._rolls
+        num_of_rolls = rolls.shape[0]
+        chunk_size = self.chunk_size or max(math.ceil(num_of_rolls / self.workers), 1)
+        row_ranges = [(start, min(start + chunk_size, num_of_rolls)) for start in range(0, num_of_rolls, chunk_size)]
+        if self.workers == 1 or not row_ranges:
+            return [
+                _count_partial(rolls, start, stop, len(self.game._faces), statistic)
+                for start, stop in row_ranges or [(0, 0)]
+            ]
+
+        if self._shared_rolls is not None and self._shared_rolls.source is not rolls:
+            self._shared_rolls.close()
+            self._shared_rolls = None
+        if self._shared_rolls is None:
+            self._shared_rolls = SharedRolls(rolls)
+
+        count = functools.partial(
+            _count_shared,
+            self._shared_rolls.name,
+            self._shared_rolls.shape,
+            self._shared_rolls.dtype.str,
+            len(self.game._faces),
+            statistic)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            self._executor_finalizer = weakref.finalize(self, self._executor.shutdown)
+        return list(self._executor.map(count, row_ranges))
+
+    def calculate_jackpots(self) -> int:
+        """
+        PURPOSE: This method computes how many times the game resulted in all faces being identical.
+        INPUT: None
+        OUTPUT: int
+        """
+        self.jackpots_df = _merge_jackpots(
+            self._map("jackpots"), self.game._faces, self.num_of_dice, self.game._rolls.shape[0])
+        return self.jackpots_df.shape[0]
+
+    def calculate_combos(self) -> None:
+        """
+        PURPOSE: This method computes the distinct combinations of faces rolled, along with their counts,
+            where combinations are sorted and saved as a multi-columned index
+        INPUT: None
+        OUTPUT: None
+        """
+        self.combos_df = _merge_combos(self._map("combos"), self.game._faces)
+
+    def calculate_face_rolled_occurrences(self) -> None:
+        """
+        PURPOSE: This method computes how many times a given face is rolled in each event.
+        INPUT: None
+        OUTPUT: None
+        """
+        self.face_rolled_occurrences_df = _merge_face_occurrences(
+            self._map("face_rolled_occurrences"), self.game._faces)
+
+    def close(self) -> None:
+        """
+        PURPOSE: This method shuts the worker processes down and frees the shared memory block
+            holding the roll-code matrix.
+        INPUT: None
+        OUTPUT: None
+        """
+        if self._executor is not None:
+            self._executor_finalizer()
+            self._executor = None
+        if self._shared_rolls is not None:
+            self._shared_rolls.close()
+            self._shared_rolls = None
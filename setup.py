@@ -9,7 +9,14 @@ setup(
     packages = ['montecarlo'],
     description = 'A package creates and analyzes games with configurable dice',
     install_requires = [
+        "numpy",
         "pandas"
     ],
+    extras_require = {
+        "arrow": ["pyarrow"]
+    },
+    entry_points = {
+        "console_scripts": ["montecarlo=montecarlo.cli:main"]
+    },
     python_requires='>3.10'
 )
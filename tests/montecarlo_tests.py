@@ -1,10 +1,23 @@
+import contextlib
+import gc
+import io
+import json
+import os
+import tempfile
 import unittest
 
 import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal
 
-from montecarlo import Analyzer, Die, Game
+from montecarlo import Analyzer, Die, Game, Replications, SharedAnalyzer, StatisticsWriter
+from montecarlo.cli import _load_dice, main
+
+try:
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
 
 
 class DieTestSuite(unittest.TestCase):
@@ -137,104 +150,10 @@ class GameTestSuite(unittest.TestCase):
         assert_frame_equal(
             game.dice[0].show(), die.show(), "Class object contained Die object should match with the input Die.")
 
-    def test_get_roll_number(self):
-        """
-        PURPOSE: Ensure correct roll number mapped list can be returned.
-        """
-        faces = [1, 2, 3, 4, 5, 6]
-        die1 = Die(faces)
-        die2 = Die(faces)
-        one_time = 1
-        three_times = 3
-
-        # With only 1 die
-        game = Game(dice=[die1])
-        # 1 time
-        actual_roll_number = game._get_roll_number(times=one_time)
-        expected_roll_number = [1]
-        self.assertEqual(actual_roll_number, expected_roll_number)
-        # 3 times
-        actual_roll_number = game._get_roll_number(times=three_times)
-        expected_roll_number = [1, 2, 3]
-        self.assertEqual(actual_roll_number, expected_roll_number)
-
-        # With multiple dice 
-        game = Game(dice=[die1, die2])
-        # 1 time
-        actual_roll_number = game._get_roll_number(times=one_time)
-        expected_roll_number = [1, 1]
-        self.assertEqual(actual_roll_number, expected_roll_number)
-        # 3 times
-        actual_roll_number = game._get_roll_number(times=three_times)
-        expected_roll_number = [1, 2, 3, 1, 2, 3]
-        self.assertEqual(actual_roll_number, expected_roll_number)
-
-    def test_get_die_number(self):
-        """
-        PURPOSE: Ensure correct die number mapped list can be returned.
-        """
-        faces = [1, 2, 3, 4, 5, 6]
-        die1 = Die(faces)
-        die2 = Die(faces)
-        one_time = 1
-        three_times = 3
-
-        # With only 1 die
-        game = Game(dice=[die1])
-        # 1 time
-        actual_die_number = game._get_die_number(times=one_time)
-        expected_die_number = [0]
-        self.assertEqual(actual_die_number, expected_die_number)
-        # 3 times
-        actual_die_number = game._get_die_number(times=three_times)
-        expected_die_number = [0, 0, 0]
-        self.assertEqual(actual_die_number, expected_die_number)
-
-        # With multiple dice 
-        game = Game(dice=[die1, die2])
-        # 1 time
-        actual_die_number = game._get_die_number(times=one_time)
-        expected_die_number = [0, 1]
-        self.assertEqual(actual_die_number, expected_die_number)
-        # 3 times
-        actual_die_number = game._get_die_number(times=three_times)
-        expected_die_number = [0, 0, 0, 1, 1, 1]
-        self.assertEqual(actual_die_number, expected_die_number)
-
-    def test_roll_dice(self):
-        """
-        PURPOSE: Ensure correct dice rolling results can be returned.
-        """
-        faces = [1, 2, 3, 4, 5, 6]
-        die1 = Die(faces)
-        die2 = Die(faces)
-        one_time = 1
-        three_times = 3
-
-        # With only 1 die
-        game = Game(dice=[die1])
-        # 1 time
-        actual_face_rolled = game._roll_dice(times=one_time)
-        self.assertTrue(actual_face_rolled[0] in faces)
-        # 3 times
-        actual_face_rolled = game._roll_dice(times=three_times)
-        for i in range(three_times * 1):
-            self.assertTrue(actual_face_rolled[i] in faces)
-
-        # With multiple dice 
-        game = Game(dice=[die1, die2])
-        # 1 time
-        actual_face_rolled = game._roll_dice(times=one_time)
-        for i in range(one_time * 2):
-            self.assertTrue(actual_face_rolled[i] in faces)
-        # 3 times
-        actual_face_rolled = game._roll_dice(times=three_times)
-        for i in range(three_times * 2):
-            self.assertTrue(actual_face_rolled[i] in faces)
-
     def test_play(self):
         """
-        PURPOSE: Ensure play method returns correct dataframe.
+        PURPOSE: Ensure play method returns correct dataframe, with roll and die numbers in the
+            smallest dtypes that fit them.
         """
         faces = [1, 2, 3, 4, 5, 6]
         die1 = Die(faces)
@@ -250,7 +169,7 @@ class GameTestSuite(unittest.TestCase):
         expected = pd.DataFrame({
             'roll_number': [1],
             'die_number': [0]
-        }).set_index('roll_number')
+        }, dtype=np.uint8).set_index('roll_number')
         assert_frame_equal(actual, expected)
 
         # 3 times
@@ -259,7 +178,7 @@ class GameTestSuite(unittest.TestCase):
         expected = pd.DataFrame({
             'roll_number': [1, 2, 3],
             'die_number': [0, 0, 0]
-        }).set_index('roll_number')
+        }, dtype=np.uint8).set_index('roll_number')
         assert_frame_equal(actual, expected)
 
         # With multiple die
@@ -270,7 +189,7 @@ class GameTestSuite(unittest.TestCase):
         expected = pd.DataFrame({
             'roll_number': [1, 1],
             'die_number': [0, 1]
-        }).set_index('roll_number')
+        }, dtype=np.uint8).set_index('roll_number')
         assert_frame_equal(actual, expected)
 
         # 3 times
@@ -279,9 +198,101 @@ class GameTestSuite(unittest.TestCase):
         expected = pd.DataFrame({
             'roll_number': [1, 2, 3, 1, 2, 3],
             'die_number': [0, 0, 0, 1, 1, 1]
-        }).set_index('roll_number')
+        }, dtype=np.uint8).set_index('roll_number')
         assert_frame_equal(actual, expected)
 
+    def test_play_compact_storage(self):
+        """
+        PURPOSE: Ensure only the face codes are stored, in the smallest dtype that fits the faces.
+        """
+        game = Game(dice=[Die([1, 2, 3, 4, 5, 6]), Die([1, 2, 3, 4, 5, 6])])
+        game.play(times=1000)
+        self.assertEqual(game._rolls.dtype, np.uint8)
+        self.assertEqual(game._rolls.shape, (1000, 2))
+        self.assertEqual(game.memory_usage(), 1000 * 2 + 6 * 8)
+        self.assertEqual(game._play_df.index.dtype, np.uint16)
+
+        game = Game(dice=[Die(list(range(300)))])
+        game.play(times=10)
+        self.assertEqual(game._rolls.dtype, np.uint16)
+
+        game = Game(dice=[Die(['heads', 'tails'])])
+        game.play(times=10)
+        self.assertGreater(game.memory_usage(), game._rolls.nbytes + game._faces.nbytes)
+
+    def test_play_mixed_faces(self):
+        """
+        PURPOSE: Ensure dice with faces that cannot be compared can still be played and shown.
+        """
+        for dice in ([Die([1, 'a'])], [Die([1, 2]), Die(['a', 'b'])]):
+            game = Game(dice=dice)
+            game.play(times=10)
+            faces = {face for die in dice for face in die.show()['faces']}
+            self.assertTrue(set(game.show(display="narrow")['face_rolled']) <= faces)
+
+    def test_play_with_seed(self):
+        """
+        PURPOSE: Ensure games with the same seed play the same rolls.
+        """
+        faces = [1, 2, 3, 4, 5, 6]
+        game1 = Game(dice=[Die(faces), Die(faces)], seed=42)
+        game2 = Game(dice=[Die(faces), Die(faces)], seed=42)
+        game1.play(times=10)
+        game2.play(times=10)
+        assert_frame_equal(game1.show(), game2.show())
+
+        game3 = Game(dice=[Die(faces), Die(faces)], seed=game1.seed + 1)
+        game3.play(times=10)
+        self.assertFalse(game1.show().equals(game3.show()))
+
+    def test_roll_block(self):
+        """
+        PURPOSE: Ensure any block of rolls can be regenerated without replaying the blocks before it.
+        """
+        faces = [1, 2, 3, 4, 5, 6]
+        game = Game(dice=[Die(faces), Die(faces)], seed=7, block_size=4)
+        game.play(times=10)
+
+        np.testing.assert_array_equal(game.roll_block(1), game._rolls[4:8])
+        np.testing.assert_array_equal(game.roll_block(2, rolls=2), game._rolls[8:10])
+        np.testing.assert_array_equal(game.roll_range(3, 9), game._rolls[3:9])
+        self.assertRaises(ValueError, game.roll_block, -1)
+
+    def test_roll_block_with_weights(self):
+        """
+        PURPOSE: Ensure faces with no weight are never rolled.
+        """
+        die = Die([1, 2, 3])
+        die.update_weight(face=2, new_weight=0)
+        game = Game(dice=[die], seed=3)
+        game.play(times=100)
+        self.assertNotIn(2, game.show(display="narrow")['face_rolled'].to_list())
+
+    def test_play_with_incorrect_weights(self):
+        """
+        PURPOSE: Play should fail if the weights of a die add up to zero or are negative.
+        """
+        die = Die([1, 2, 3])
+        for face in [1, 2, 3]:
+            die.update_weight(face=face, new_weight=0)
+        self.assertRaises(ValueError, Game(dice=[die]).play, 3)
+
+        die = Die([1, 2, 3])
+        die.update_weight(face=1, new_weight=-1)
+        self.assertRaises(ValueError, Game(dice=[die]).play, 3)
+
+        die = Die([1, 2, 3])
+        die.update_weight(face=1, new_weight=float('nan'))
+        self.assertRaises(ValueError, Game(dice=[die]).play, 3)
+
+    def test_game_initialization_incorrect_seed(self):
+        """
+        PURPOSE: Instantiation should fail if the seed is not a non-negative integer.
+        """
+        die = Die([1, 2, 3])
+        self.assertRaises(ValueError, Game, [die], -1)
+        self.assertRaises(ValueError, Game, [die], 1.5)
+
     def test_show_wide(self):
         """
         PURPOSE: Ensure show method returns the dataframe in the correct
@@ -471,5 +482,325 @@ class AnalyzerTestSuite(unittest.TestCase):
         self.assertEqual(list(actual_df.index), [1, 2, 3])
 
 
+class ReplicationsTestSuite(unittest.TestCase):
+    def test_replications_initialization(self):
+        """
+        PURPOSE: Ensure all replications are rolled in one draw, reproducibly from the game seed.
+        """
+        faces = [1, 2, 3, 4, 5, 6]
+        game = Game(dice=[Die(faces), Die(faces), Die(faces)], seed=11)
+        replications = Replications(game=game, replications=4, times=10)
+        self.assertEqual(replications._rolls.shape, (4, 10, 3))
+        np.testing.assert_array_equal(
+            replications._rolls, Replications(game=game, replications=4, times=10)._rolls)
+
+        self.assertEqual(replications.jackpots_df, None)
+        self.assertEqual(replications.combos_df, None)
+        self.assertEqual(replications.face_frequencies_df, None)
+
+    def test_replications_initialization_falsy(self):
+        """
+        PURPOSE: Instantiation should fail without dice, replications or rolls.
+        """
+        die = Die([1, 2, 3])
+        self.assertRaises(ValueError, Replications, Game(dice=[]), 2, 2)
+        self.assertRaises(ValueError, Replications, Game(dice=[die]), 0, 2)
+        self.assertRaises(ValueError, Replications, Game(dice=[die]), 2, 0)
+
+    def test_replications_calculate_jackpots(self):
+        """
+        PURPOSE: Ensure jackpots are counted per replication.
+        """
+        die = Die([1, 2])
+        die.update_weight(face=2, new_weight=0)
+        game = Game(dice=[die, die])
+        replications = Replications(game=game, replications=3, times=5)
+        jackpots = replications.calculate_jackpots()
+        self.assertEqual(jackpots.to_list(), [5, 5, 5])
+        self.assertEqual(list(jackpots.index), [1, 2, 3])
+        self.assertEqual(list(replications.jackpots_df.columns), ['jackpots'])
+
+    def test_replications_by_index(self):
+        """
+        PURPOSE: Ensure every replication has its own rolls and can be regenerated by index,
+            whatever the batch it is rolled in.
+        """
+        faces = [1, 2, 3, 4, 5, 6]
+        game = Game(dice=[Die(faces), Die(faces), Die(faces)], seed=13, block_size=8)
+        replications = Replications(game=game, replications=6, times=3)
+        later = Replications(game=game, replications=4, times=3, first=2)
+
+        np.testing.assert_array_equal(later._rolls, replications._rolls[2:6])
+        self.assertEqual(list(later._replication_number), [3, 4, 5, 6])
+        self.assertFalse((replications._rolls[:3] == replications._rolls[3:]).all())
+
+    def test_replications_calculate_combos_and_face_frequencies(self):
+        """
+        PURPOSE: Ensure combos and face frequencies of each replication add up to its rolls.
+        """
+        faces = ['H', 'T']
+        game = Game(dice=[Die(faces), Die(faces)])
+        replications = Replications(game=game, replications=6, times=8)
+
+        replications.calculate_combos()
+        self.assertEqual(replications.combos_df.shape[0], 6)
+        self.assertTrue(set(replications.combos_df.columns) <= {"('H', 'H')", "('H', 'T')", "('T', 'T')"})
+        self.assertEqual(replications.combos_df.sum(axis=1).to_list(), [8] * 6)
+
+        replications.calculate_face_frequencies()
+        self.assertEqual(list(replications.face_frequencies_df.columns), faces)
+        self.assertEqual(replications.face_frequencies_df.sum(axis=1).to_list(), [16] * 6)
+
+
+class SharedAnalyzerTestSuite(unittest.TestCase):
+    def test_shared_analyzer_matches_analyzer(self):
+        """
+        PURPOSE: Ensure merged partial counts from the worker processes match the serial analyzer.
+        """
+        for faces, num_of_dice, workers in [([1, 2, 3, 4, 5, 6], 3, 2), (['H', 'T'], 2, 2), ([1, 2, 3], 2, 1)]:
+            game = Game(dice=[Die(faces) for _ in range(num_of_dice)])
+            game.play(times=50)
+            analyzer = Analyzer(game=game)
+
+            with SharedAnalyzer(game=game, workers=workers, chunk_size=7) as shared_analyzer:
+                self.assertEqual(shared_analyzer.calculate_jackpots(), analyzer.calculate_jackpots())
+                assert_frame_equal(shared_analyzer.jackpots_df, analyzer.jackpots_df)
+
+                shared_analyzer.calculate_combos()
+                analyzer.calculate_combos()
+                assert_frame_equal(shared_analyzer.combos_df, analyzer.combos_df)
+
+                shared_analyzer.calculate_face_rolled_occurrences()
+                analyzer.calculate_face_rolled_occurrences()
+                assert_frame_equal(
+                    shared_analyzer.face_rolled_occurrences_df, analyzer.face_rolled_occurrences_df)
+
+    def test_shared_analyzer_follows_new_play(self):
+        """
+        PURPOSE: Ensure the shared roll-code matrix is refreshed when the game is played again.
+        """
+        game = Game(dice=[Die([1, 2, 3]), Die([1, 2, 3])])
+        game.play(times=5)
+        with SharedAnalyzer(game=game, workers=1) as shared_analyzer:
+            shared_analyzer.calculate_face_rolled_occurrences()
+            game.play(times=8)
+            shared_analyzer.calculate_face_rolled_occurrences()
+            self.assertEqual(list(shared_analyzer.face_rolled_occurrences_df.index), list(range(1, 9)))
+
+    def test_shared_analyzer_frees_shared_memory(self):
+        """
+        PURPOSE: Ensure the shared memory block and the workers are released without calling close.
+        """
+        game = Game(dice=[Die([1, 2, 3]), Die([1, 2, 3])])
+        game.play(times=20)
+        shared_analyzer = SharedAnalyzer(game=game, workers=2)
+        shared_analyzer.calculate_jackpots()
+        executor = shared_analyzer._executor
+        shared_analyzer.calculate_combos()
+        self.assertIs(shared_analyzer._executor, executor)
+
+        shared_rolls_finalizer = shared_analyzer._shared_rolls._finalizer
+        executor_finalizer = shared_analyzer._executor_finalizer
+        del shared_analyzer
+        gc.collect()
+        self.assertFalse(shared_rolls_finalizer.alive)
+        self.assertFalse(executor_finalizer.alive)
+
+    def test_shared_analyzer_incorrect_workers(self):
+        """
+        PURPOSE: Instantiation should fail if the number of workers is not positive.
+        """
+        game = Game(dice=[Die([1, 2, 3])])
+        self.assertRaises(ValueError, SharedAnalyzer, game, 0)
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class StatisticsWriterTestSuite(unittest.TestCase):
+    def test_write_parquet(self):
+        """
+        PURPOSE: Ensure streamed parquet files hold the same statistics as the analyzer.
+        """
+        faces = [1, 2, 3]
+        game = Game(dice=[Die(faces), Die(faces)], seed=5)
+        game.play(times=40)
+        analyzer = Analyzer(game=game)
+        analyzer.calculate_jackpots()
+        analyzer.calculate_combos()
+        analyzer.calculate_face_rolled_occurrences()
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = StatisticsWriter(game=game, directory=directory, chunk_size=7).write()
+            self.assertEqual(paths['jackpots'], os.path.join(directory, 'jackpots.parquet'))
+
+            jackpots_df = pyarrow.parquet.read_table(paths['jackpots']).to_pandas()
+            self.assertEqual(
+                list(zip(jackpots_df['roll_number'], jackpots_df['face_rolled'])), list(analyzer.jackpots_df.index))
+
+            combos_df = pyarrow.parquet.read_table(paths['combos']).to_pandas().set_index('face_rolled')
+            assert_frame_equal(combos_df, analyzer.combos_df)
+
+            occurrences_df = pyarrow.parquet.read_table(paths['face_rolled_occurrences']).to_pandas()
+            self.assertEqual(list(occurrences_df.columns), ['roll_number', '1', '2', '3'])
+            np.testing.assert_array_equal(
+                occurrences_df[['1', '2', '3']].to_numpy(), analyzer.face_rolled_occurrences_df.fillna(0).to_numpy())
+
+    def test_write_arrow_regenerated(self):
+        """
+        PURPOSE: Ensure rolls regenerated chunk by chunk are written the same as the played rolls.
+        """
+        faces = ['H', 'T']
+        game = Game(dice=[Die(faces), Die(faces), Die(faces)], seed=8, block_size=16)
+        game.play(times=50)
+
+        with tempfile.TemporaryDirectory() as directory:
+            played = StatisticsWriter(
+                game=game, directory=os.path.join(directory, 'played'), file_format='arrow').write()
+            regenerated = StatisticsWriter(
+                game=Game(dice=game.dice, seed=8, block_size=16),
+                directory=os.path.join(directory, 'regenerated'),
+                file_format='arrow',
+                chunk_size=5).write(times=50)
+
+            for name in ('jackpots', 'combos', 'face_rolled_occurrences'):
+                self.assertTrue(
+                    pyarrow.ipc.open_file(played[name]).read_all().equals(
+                        pyarrow.ipc.open_file(regenerated[name]).read_all()))
+
+    def test_writer_incorrect_format(self):
+        """
+        PURPOSE: Instantiation should fail for an unknown file format.
+        """
+        game = Game(dice=[Die([1, 2, 3])])
+        self.assertRaises(ValueError, StatisticsWriter, game, '.', 'csv')
+
+    def test_writer_incorrect_faces(self):
+        """
+        PURPOSE: Instantiation should fail for faces of mixed types or faces named the same as text.
+        """
+        self.assertRaises(ValueError, StatisticsWriter, Game(dice=[Die([1, 'H'])]), '.')
+        self.assertRaises(ValueError, StatisticsWriter, Game(dice=[Die([1, 2]), Die(['1', '2'])]), '.')
+
+    def test_write_incorrect_times(self):
+        """
+        PURPOSE: Writing should fail for negative times, or without times before the game is played.
+        """
+        game = Game(dice=[Die([1, 2, 3])])
+        with tempfile.TemporaryDirectory() as directory:
+            writer = StatisticsWriter(game=game, directory=directory)
+            self.assertRaises(ValueError, writer.write)
+            self.assertRaises(ValueError, writer.write, -1)
+
+
+class CliTestSuite(unittest.TestCase):
+    def test_load_dice_json(self):
+        """
+        PURPOSE: Ensure dice are created from a JSON die spec file, with optional weights.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'dice.json')
+            with open(path, 'w') as file:
+                json.dump([{'faces': [1, 2, 3], 'weights': [1, 1, 2]}, {'faces': [1, 2, 3]}], file)
+            dice = _load_dice(path)
+
+        self.assertEqual(len(dice), 2)
+        self.assertEqual(list(dice[0].show()['weights']), [1.0, 1.0, 2.0])
+        self.assertEqual(list(dice[1].show()['weights']), [1.0, 1.0, 1.0])
+
+    def test_load_dice_csv(self):
+        """
+        PURPOSE: Ensure dice are created from a CSV die spec file, one row per face.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'dice.csv')
+            with open(path, 'w') as file:
+                file.write('die,face,weight\na,H,1\na,T,3\nb,H,1\nb,T,1\n')
+            dice = _load_dice(path)
+
+        self.assertEqual(len(dice), 2)
+        self.assertEqual(list(dice[0].show()['faces']), ['H', 'T'])
+        self.assertEqual(list(dice[0].show()['weights']), [1.0, 3.0])
+
+    def test_load_dice_incorrect_weights(self):
+        """
+        PURPOSE: Loading should fail for negative, missing or non-finite weights and for repeated faces.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'dice.csv')
+            with open(path, 'w') as file:
+                file.write('die,face,weight\na,H,1\na,T,\n')
+            self.assertRaises(ValueError, _load_dice, path)
+
+            path = os.path.join(directory, 'dice.json')
+            for spec in (
+                {'faces': [1, 2], 'weights': [1, -1]},
+                {'faces': [1, 2], 'weights': [1, float('nan')]},
+                {'faces': [1, 2], 'weights': [0, 0]},
+                {'faces': [1, 1]}
+            ):
+                with open(path, 'w') as file:
+                    json.dump([spec], file)
+                self.assertRaises(ValueError, _load_dice, path)
+
+    def test_main(self):
+        """
+        PURPOSE: Ensure the console script plays, writes and reports a seeded game.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'dice.json')
+            with open(path, 'w') as file:
+                json.dump([{'faces': [1, 2, 3]}, {'faces': [1, 2, 3]}], file)
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                exit_code = main([path, '--times', '100', '--seed', '4', '--format', 'csv', '-o', directory])
+
+            self.assertEqual(exit_code, 0)
+            self.assertTrue(os.path.exists(os.path.join(directory, 'combos.csv')))
+
+        game = Game(dice=[Die([1, 2, 3]), Die([1, 2, 3])], seed=4)
+        game.play(times=100)
+        report = output.getvalue()
+        self.assertIn('seed: 4', report)
+        self.assertIn(f'jackpots: {Analyzer(game=game).calculate_jackpots()}', report)
+        self.assertIn('rolls/sec:', report)
+        self.assertIn('peak memory:', report)
+
+    def test_main_incorrect_dice(self):
+        """
+        PURPOSE: The console script should exit with an error for an unknown die spec file.
+        """
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertRaises(SystemExit, main, ['dice.txt', '--times', '3'])
+
+    def test_main_malformed_json(self):
+        """
+        PURPOSE: The console script should exit with an error for JSON that is not a list of die specs.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'dice.json')
+            with open(path, 'w') as file:
+                json.dump([[1, 2]], file)
+
+            with contextlib.redirect_stderr(io.StringIO()):
+                self.assertRaises(SystemExit, main, [path, '--times', '3'])
+
+    def test_main_options_not_applied(self):
+        """
+        PURPOSE: The console script should reject options that do not apply to the chosen output.
+        """
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertRaises(SystemExit, main, ['dice.json', '--times', '3', '--workers', '2', '-o', 'out'])
+            self.assertRaises(SystemExit, main, ['dice.json', '--times', '3', '--format', 'csv'])
+
+    def test_main_incorrect_seed(self):
+        """
+        PURPOSE: The console script should report a seed out of range as a seed error.
+        """
+        error = io.StringIO()
+        with contextlib.redirect_stderr(error):
+            self.assertRaises(SystemExit, main, ['dice.json', '--times', '3', '--seed', '-5'])
+        self.assertIn('--seed', error.getvalue())
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=3)